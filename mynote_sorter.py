@@ -3,44 +3,84 @@ from __future__ import annotations
 
 import sys
 import re
+from functools import lru_cache
 from dataclasses import dataclass
 from datetime import date as _date
 from pathlib import Path as p
 from typing import List, Optional, Tuple
 from itertools import groupby
+from operator import attrgetter
 from datetime import timedelta
 
 # \s* を使わず、データの通りに「スペース1つ」を厳格に指定
 # 末尾に \n を入れないことで、最終行や改行コードの差異に強くします
-DELIMITER_PARENT = r"(^## \[[x ]?\] \d{4}/\d{2}/\d{2}(?:\((?:[月火水木金土日]|Mon|Tue|Wed|Thu|Fri|Sat|Sun)?\))? .+$)"
-DELIMITER_CHILD = r"(^- \[[x ]?\] \d{4}/\d{2}/\d{2}(?:\((?:[月火水木金土日]|Mon|Tue|Wed|Thu|Fri|Sat|Sun)\))? .+$)"
-
+# タイトル部は .+ ではなく [^\n]+ で行内に閉じ込め、$ 前での後戻りを防ぐ
 # 抽出用（PICKPTN）は、タイトルを確実に取るために [^\n]+ を使用
 PICKPTN_PARENT = r"^## (?P<status>\[[x ]?\]) (?P<date>\d{4}/\d{2}/\d{2}(?:\((?:[月火水木金土日]|Mon|Tue|Wed|Thu|Fri|Sat|Sun)\))?) (?P<title>[^\n]+)(?:\n(?P<rest>[\s\S]*))?$"
 PICKPTN_CHILD = r"^- (?P<status>\[[x ]?\]) (?P<date>\d{4}/\d{2}/\d{2}(?:\((?:[月火水木金土日]|Mon|Tue|Wed|Thu|Fri|Sat|Sun)\))?) (?P<title>[^\n]+)(?:\n(?P<rest>[\s\S]*))?$"
 
+# 呼び出しごとの re キャッシュ参照を避けるため、モジュールロード時に一度だけコンパイル
+PICKPTN_PARENT_RE = re.compile(PICKPTN_PARENT, re.MULTILINE)
+PICKPTN_CHILD_RE = re.compile(PICKPTN_CHILD, re.DOTALL)
+
+# 親/子の行パターン。グループは (status)(date)(title) の並びで位置アクセスする
+PARENT_LINE = r"^## (\[[x ]?\]) (\d{4}/\d{2}/\d{2}(?:\((?:[月火水木金土日]|Mon|Tue|Wed|Thu|Fri|Sat|Sun)?\))?) ([^\n]+)$"
+CHILD_LINE = r"^- (\[[x ]?\]) (\d{4}/\d{2}/\d{2}(?:\((?:[月火水木金土日]|Mon|Tue|Wed|Thu|Fri|Sat|Sun)\))?) ([^\n]+)$"
+
+# 区切り検出とフィールド抽出を1本に融合したもの。
+# re.finditer で本文を1回走査するだけで、行単位の re.split + 再マッチを省く。
+MASTER_RE = re.compile(PARENT_LINE + "|" + CHILD_LINE, re.MULTILINE)
+
+# 子セクション単独の走査用。境界検出した match からそのままフィールドも取れる
+CHILD_LINE_RE = re.compile(CHILD_LINE, re.MULTILINE)
+
 WEEKDAYS_JP = ["月", "火", "水", "木", "金", "土", "日"]
 
+# "(月)" 〜 "(日)" の7通りしかないので、サフィックスは作り置きして連結するだけにする
+_WD_SUFFIX = tuple(f"({w})" for w in WEEKDAYS_JP)
+
 SUNDAY = "-----------------------------------"
 
+# ソートキーはPython製lambdaではなくC実装のattrgetterで引く
+BY_DATE = attrgetter("date")
+BY_TITLE = attrgetter("title")
+
 
 class MyTask:
+    # インスタンスごとの __dict__ を作らせない（メモリ削減と属性参照の高速化）
+    __slots__ = ("body", "top_memo", "parents", "out")
+
     def __init__(self, body):
         self.body = body
         self.parse_chunks()
 
     def parse_chunks(self):
-        parts = re.split(DELIMITER_PARENT, self.body, flags=re.MULTILINE)
-        self.top_memo = parts[0].rstrip()
-        chunks = [parts[i] + parts[i + 1] for i in range(1, len(parts), 2)]
-
-        all_parents = [Parent(x) for x in chunks]
+        body = self.body
+        matches = list(MASTER_RE.finditer(body))
+        # group 1 = pstatus（名前引きのdictルックアップを避けて位置で引く）
+        parent_idxs = [i for i, m in enumerate(matches) if m[1] is not None]
+
+        if not parent_idxs:
+            self.top_memo = body.rstrip()
+            self.parents = []
+            return
+
+        # 最初の親より前は（子っぽい行も含めて）丸ごと top_memo
+        self.top_memo = body[: matches[parent_idxs[0]].start()].rstrip()
+
+        # 境界の数は既知なので、append成長ではなく内包表記で一発確保する
+        n_matches = len(matches)
+        next_idxs = parent_idxs[1:] + [n_matches]
+        all_parents = [
+            Parent.from_matches(body, matches[i], matches[i + 1 : j], matches[j].start() if j < n_matches else len(body))
+            for i, j in zip(parent_idxs, next_idxs)
+        ]
         all_parents = del_sunday(all_parents)
-        all_parents.sort(key=lambda x: x.title, reverse=True)
+        all_parents.sort(key=BY_TITLE, reverse=True)
 
         # parentの整理
         bind_parents = []
-        for title, group in groupby(all_parents, key=lambda x: x.title):
+        for title, group in groupby(all_parents, key=BY_TITLE):
             p_list = list(group)
             base = p_list[0]
 
@@ -49,125 +89,136 @@ class MyTask:
                 for other in p_list[1:]:
                     base.childs.extend(other.childs)
 
-            # top_memo
-            top_memos = []
-            for pt in p_list:
-                if len(pt.top_memo) > 0:
-                    top_memos.append(f"{pt.top_memo}\n")
-            top_memos = set(top_memos)
+            # top_memo（dict.fromkeysで順序を保ったまま重複排除し、joinにはlistを渡す）
+            top_memos = list(dict.fromkeys(f"{pt.top_memo}\n" for pt in p_list if pt.top_memo))
             base.top_memo = "".join(top_memos).rstrip("\n")
 
-            # status更新
-            if any(x.status == "[]" for x in base.childs):
-                base.status = "[]"
-
-            # 日付更新
-            open_childs = [x for x in base.childs if x.status == "[]"]
-            closed_childs = [x for x in base.childs if x.status == "[x]"]
+            # status・日付更新（1パスで振り分けて両方に使う）
+            open_childs = []
+            closed_childs = []
+            buckets = {"[]": open_childs.append, "[x]": closed_childs.append}
+            for c in base.childs:
+                put = buckets.get(c.status)
+                if put is not None:
+                    put(c)
             if open_childs:
+                base.status = "[]"
                 base.date = min(c.date for c in open_childs)
             elif closed_childs:
                 base.date = max(c.date for c in closed_childs)
 
-            # 再ソート
-            base.sort()
+            # 再ソートはマージで子が増えた時だけ（単独parentはparse時点でソート済み）
+            if len(p_list) > 1:
+                base.sort()
             bind_parents.append(base)
         self.parents = bind_parents
 
     def parent_root_build(self):
-        out = f"{self.top_memo}\n"
-        open_parents = [x for x in self.parents if x.status == "[]"]
-        open_parents = sorted(open_parents, key=lambda x: x.date)
-        closed_parents = [x for x in self.parents if x.status == "[x]"]
-        closed_parents = sorted(closed_parents, key=lambda x: x.date, reverse=True)
+        # str += の繰り返しは毎回コピーが走るので、リストに溜めて最後に1回joinする
+        buf = [f"{self.top_memo}\n"]
+        # 2回のフィルタ走査を1パスの振り分けにまとめる（statusでdictディスパッチ）
+        open_parents = []
+        closed_parents = []
+        buckets = {"[]": open_parents.append, "[x]": closed_parents.append}
+        for x in self.parents:
+            put = buckets.get(x.status)
+            if put is not None:
+                put(x)
+        open_parents.sort(key=BY_DATE)
+        closed_parents.sort(key=BY_DATE, reverse=True)
         parents = open_parents + closed_parents
+        append = buf.append  # ループ内の属性参照を減らす
         for parent in parents:
-            out += f"## {parent.status} {parent.date} {parent.title}"
-            out += f"\n"
+            append(f"## {parent.status} {parent.date} {parent.title}\n")
             if len(parent.top_memo) > 1:
-                out += f"{parent.top_memo}\n"
+                append(f"{parent.top_memo}\n")
 
-            open_childs = [x for x in parent.childs if x.status == "[]"]
-            open_childs = sorted(open_childs, key=lambda x: x.date, reverse=True)
-            closed_childs = [x for x in parent.childs if x.status == "[x]"]
-            closed_childs = sorted(closed_childs, key=lambda x: x.date, reverse=True)
-            childs = open_childs + closed_childs
+            # 子は未完了→完了の順でどちらも日付降順なので、1回のソートで並べられる
+            childs = [x for x in parent.childs if x.status == "[]" or x.status == "[x]"]
+            childs.sort(key=lambda x: (x.status == "[]", x.date), reverse=True)
             for child in childs:
-                out += f"{child.out}\n"
-        self.out = out
+                append(f"{child.out}\n")
+        self.out = "".join(buf)
         return self.out
 
     def child_root_build(self):
-        out = f"{self.top_memo}\n"
+        buf = [f"{self.top_memo}\n"]
+        append = buf.append  # ループ内の属性参照を減らす
 
         # 未完了子タスクの一括集約
         all_open = []
         for parent in self.parents:
-            if parent.title != SUNDAY:
+            if not parent.is_sunday:
                 all_open.extend([c for c in parent.childs if c.status == "[]"])
 
         # 未完了パート：日付順にバラして出力
         if all_open:
             all_open = add_sunday(all_open)
-            all_open.sort(key=lambda x: x.date)
+            all_open.sort(key=BY_DATE)
             for child in all_open:
-                if child.parent.title == SUNDAY:
-                    out += f"## [] {child.date} {child.parent.title}\n\n"
+                parent = child.parent  # 属性チェーンの引き直しを避ける
+                if parent.is_sunday:
+                    append(f"## [] {child.date} {parent.title}\n\n")
                 else:
-                    if child.parent.top_memo and not child.parent.topnotwrote:
-                        out += f"## [] {child.date} {child.parent.title}\n{child.parent.top_memo}\n{child.out}\n\n"
-                        child.parent.topnotwrote = True
+                    if parent.top_memo and not parent.topnotwrote:
+                        append(f"## [] {child.date} {parent.title}\n{parent.top_memo}\n{child.out}\n\n")
+                        parent.topnotwrote = True
                     else:
-                        out += f"## [] {child.date} {child.parent.title}\n{child.out}\n\n"
+                        append(f"## [] {child.date} {parent.title}\n{child.out}\n\n")
 
         # 完了パート、その他パート：親タスク（Parent）ごとにまとめて出力
         closed_parents = [parent for parent in self.parents if any(c.status != "[]" for c in parent.childs)]
         for parent in closed_parents:
             parent.date = max(x.date for x in [y for y in parent.childs if y.status != "[]"])
-        closed_parents.sort(key=lambda x: x.date, reverse=True)
+        closed_parents.sort(key=BY_DATE, reverse=True)
 
         for parent in closed_parents:
-            out += f"## [x] {parent.date} {parent.title}\n"
+            append(f"## [x] {parent.date} {parent.title}\n")
             if parent.top_memo and not parent.topnotwrote:
-                out += f"{parent.top_memo}\n"
+                append(f"{parent.top_memo}\n")
                 parent.topnotwrote = True
 
             for child in parent.childs:
                 if child.status == "[x]":
-                    out += f"{child.out}\n"
-            out += "\n"
+                    append(f"{child.out}\n")
+            append("\n")
 
-        self.out = out
+        self.out = "".join(buf)
         return self.out
 
 
+def _to_date(s: str) -> _date:
+    # "YYYY/MM/DD(曜)" 形式の文字列を date に戻す
+    return _date(*map(int, s.split("(")[0].split("/")))
+
+
 def add_sunday(open_childs: List[Child]) -> List[Child]:
     if not open_childs:
         return []
 
-    to_d = lambda s: _date(*map(int, s.split("(")[0].split("/")))
-    cur = to_d(min(x.date for x in open_childs))
-    end = to_d(max(x.date for x in open_childs))
+    cur = _to_date(min(x.date for x in open_childs))
+    end = _to_date(max(x.date for x in open_childs))
     cur += timedelta(days=(6 - cur.weekday()))
 
     sundays = []
     while cur <= end:
         d_str = fix_weekday_jp(cur.strftime("%Y/%m/%d"))
 
-        # 日曜日の親子
-        p_sun = Parent(f"## [] {d_str} {SUNDAY}\n")
-        c_sun = Child(f"- [] {d_str} {SUNDAY}", p_sun)
-        sundays.append(c_sun)
+        # 日曜日の親子。形が決まっているので文字列を組んで再パースせず直接作る
+        p_sun = Parent.make_sunday(d_str)
+        sundays.append(p_sun.childs[0])
         cur += timedelta(days=7)
 
     return open_childs + sundays
 
 
 def del_sunday(tasks):
-    return [x for x in tasks if x.title != SUNDAY]
+    return [x for x in tasks if not x.is_sunday]
 
 
 class Parent:
+    __slots__ = ("chunk", "status", "date", "title", "is_sunday", "opendate", "closeddate", "top_memo", "childs", "topnotwrote")
+
     def __init__(self, chunk):
         self.chunk = chunk
         self.parse()
@@ -175,30 +226,87 @@ class Parent:
         self.sort()
         self.topnotwrote = False
 
+    @classmethod
+    def make_sunday(cls, d_str):
+        # add_sunday 用の区切り行。フィールドを直接埋めて regex パースを省く
+        self = cls.__new__(cls)
+        self.chunk = f"## [] {d_str} {SUNDAY}\n"
+        self.status = "[]"
+        self.date = d_str
+        self.title = SUNDAY
+        self.is_sunday = True
+        self.opendate = self.closeddate = d_str
+        self.top_memo = ""
+        self.childs = [Child.make_sunday(d_str, self)]
+        self.topnotwrote = False
+        return self
+
+    @classmethod
+    def from_matches(cls, body, m, child_ms, end):
+        # MASTER_RE の match からの構築。行分割や再マッチをしない
+        self = cls.__new__(cls)
+        self.chunk = body[m.start() : end]
+        # MASTER_RE: 1=pstatus 2=pdate 3=ptitle
+        self.status = m[1].rstrip()
+        self.date = fix_weekday_jp(m[2].rstrip())
+        self.title = m[3].rstrip()
+        self.is_sunday = self.title == SUNDAY
+        self.opendate = self.closeddate = self.date
+
+        memo_start = min(m.end() + 1, end)  # ヘッダ行直後の改行を飛ばす
+        memo_end = child_ms[0].start() if child_ms else end
+        self.top_memo = body[memo_start:memo_end].rstrip()
+
+        if not child_ms:
+            self.childs = [Child("", self)]
+        else:
+            last = len(child_ms) - 1
+            self.childs = [
+                Child.from_match(body, cm, child_ms[k + 1].start() if k < last else end, k == last, self)
+                for k, cm in enumerate(child_ms)
+            ]
+
+        self.update_date_and_status()
+        self.sort()
+        self.topnotwrote = False
+        return self
+
     def parse(self):
-        lines = self.chunk.splitlines()
-        topline = lines[0]
-        m = re.match(PICKPTN_PARENT, topline, flags=re.MULTILINE)
-        self.status = m.group("status").rstrip()
-        self.date = m.group("date").rstrip()
-        self.date = fix_weekday_jp(self.date)
-        self.title = m.group("title").rstrip()
+        # splitlines + join で全行を舐め直さず、最初の改行で1回だけ切る
+        topline, _, child = self.chunk.partition("\n")
+        m = PICKPTN_PARENT_RE.match(topline)
+        status, date, title, _rest = m.groups()  # 1回でまとめて取り出す
+        self.status = status.rstrip()
+        self.date = fix_weekday_jp(date.rstrip())
+        self.title = title.rstrip()
+        self.is_sunday = self.title == SUNDAY
         self.opendate = self.closeddate = self.date
 
-        child = "\n".join(lines[1:]).rstrip()
-        parts = re.split(DELIMITER_CHILD, child, flags=re.MULTILINE)
-        self.top_memo = parts[0].rstrip()
-        chunks = [parts[i] + parts[i + 1] for i in range(1, len(parts), 2)]
-        if len(chunks) == 0:
+        child = child.rstrip()
+        # 子セクションが空、または子行の気配すらないなら regex を走らせない
+        if not child or "- [" not in child:
+            self.top_memo = child
+            self.childs = [Child("", self)]
+            return
+
+        # 境界検出の match からフィールドも取り、子行を2度 regex にかけない
+        ms = list(CHILD_LINE_RE.finditer(child))
+        if not ms:
+            self.top_memo = child.rstrip()
             self.childs = [Child("", self)]
         else:
-            self.childs = [Child(x, self) for x in chunks]
+            self.top_memo = child[: ms[0].start()].rstrip()
+            last = len(ms) - 1
+            self.childs = [
+                Child.from_match(child, m, ms[k + 1].start() if k < last else len(child), k == last, self, goffset=0)
+                for k, m in enumerate(ms)
+            ]
 
     def update_date_and_status(self):
+        # 最小値を取るだけなのでソートせず min で1パス
         open_childs = [x for x in self.childs if x.status == "[]"]
         if len(open_childs) > 1:
-            open_childs.sort(key=lambda x: x.date)
-            new_date = open_childs[0].date
+            new_date = min(x.date for x in open_childs)
             self.date = new_date
             self.opendate = new_date
             self.status = "[]"
@@ -207,15 +315,19 @@ class Parent:
 
         closed_childs = [x for x in self.childs if x.status == "[x]"]
         if len(closed_childs) > 1:
-            closed_childs.sort(key=lambda x: x.date)
-            new_date = closed_childs[0].date
-            self.closeddate = new_date
+            self.closeddate = min(x.date for x in closed_childs)
 
     def sort(self):
-        open_childs = [x for x in self.childs if x.status == "[]"]
-        open_childs = sorted(open_childs, key=lambda x: x.date)
-        closed_childs = [x for x in self.childs if x.status == "[x]" or x.status == "DUMMYCHILD"]
-        closed_childs = sorted(closed_childs, key=lambda x: x.date, reverse=True)
+        open_childs = []
+        closed_childs = []
+        # DUMMYCHILD は完了側にまとめて出す（従来のelif連鎖と同じ振り分け）
+        buckets = {"[]": open_childs.append, "[x]": closed_childs.append, "DUMMYCHILD": closed_childs.append}
+        for x in self.childs:
+            put = buckets.get(x.status)
+            if put is not None:
+                put(x)
+        open_childs.sort(key=BY_DATE)
+        closed_childs.sort(key=BY_DATE, reverse=True)
         self.childs = open_childs + closed_childs
         # self.out = "\n".join([x.out for x in childs])
 
@@ -227,20 +339,52 @@ class Parent:
 
 
 class Child:
+    __slots__ = ("chunk", "parent", "status", "date", "title", "rest", "out")
+
     def __init__(self, chunk, parent: Parent):
         self.chunk = chunk
         self.parent = parent
         self.parse()
         self.build()
 
+    @classmethod
+    def make_sunday(cls, d_str, parent: Parent):
+        self = cls.__new__(cls)
+        self.chunk = f"- [] {d_str} {SUNDAY}"
+        self.parent = parent
+        self.status = "[]"
+        self.date = d_str
+        self.title = SUNDAY
+        self.rest = None
+        self.build()
+        return self
+
+    @classmethod
+    def from_match(cls, body, m, end, is_last, parent: Parent, goffset=3):
+        # goffset: MASTER_RE では子グループが 4〜6、CHILD_LINE_RE 単独では 1〜3
+        self = cls.__new__(cls)
+        self.chunk = body[m.start() : end]
+        self.parent = parent
+        self.status = m[goffset + 1].rstrip()
+        self.date = fix_weekday_jp(m[goffset + 2].rstrip())
+        self.title = m[goffset + 3].rstrip()
+        rest = body[min(m.end() + 1, end) : end]
+        # 親の最後の子は（従来の子セクション一括 rstrip と同じく）全部落とす
+        rest = rest.rstrip() if is_last else rest.rstrip("\n")
+        self.rest = rest if rest else None
+        self.build()
+        return self
+
     def parse(self):
-        m = re.match(PICKPTN_CHILD, self.chunk, flags=re.DOTALL)
+        # 先頭行だけ regex にかける。rest を DOTALL で丸ごと舐めさせる必要はない
+        # 子行は必ず "- [" で始まるので、その気配がなければ regex 自体を省く
+        topline, _, raw_rest = self.chunk.partition("\n")
+        m = PICKPTN_CHILD_RE.match(topline) if topline.startswith("- [") else None
         if m:
-            self.status = m.group("status").rstrip()
-            self.date = m.group("date").rstrip()
-            self.date = fix_weekday_jp(self.date)
-            self.title = m.group("title").rstrip()
-            raw_rest = m.group("rest")
+            status, date, title, _rest = m.groups()  # 1回でまとめて取り出す
+            self.status = status.rstrip()
+            self.date = fix_weekday_jp(date.rstrip())
+            self.title = title.rstrip()
             self.rest = raw_rest.rstrip("\n") if raw_rest else None
         else:
             self.status = "DUMMYCHILD"
@@ -256,11 +400,38 @@ class Child:
         self.out = out.rstrip("\n")
 
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _zeller_weekday(y: int, mo: int, d: int) -> int:
+    # Zellerの公式。datetime.dateを生成せずに曜日（月曜=0）を求める
+    # 月ごとの実日数（うるう年込み）で検証し、datetime.date と同じ入力だけ通す
+    if not 1 <= mo <= 12:
+        raise ValueError(f"invalid date: {y}/{mo}/{d}")
+    days = _DAYS_IN_MONTH[mo - 1]
+    if mo == 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+        days = 29
+    if not 1 <= d <= days:
+        raise ValueError(f"invalid date: {y}/{mo}/{d}")
+    if mo < 3:
+        mo += 12
+        y -= 1
+    h = (d + 13 * (mo + 1) // 5 + y + y // 4 - y // 100 + y // 400) % 7
+    return (h + 5) % 7  # Zellerは土曜=0なのでPython流に補正
+
+
+@lru_cache(maxsize=None)
 def fix_weekday_jp(date_str: str) -> Optional[str]:
+    # 同じ日付が何度も出てくるので、変換結果は日付文字列ごとにキャッシュする
     try:
         y, mo, d = date_str.split("/")
-        d = d[:2]  # 古い曜日を捨てる
-        return f"{y}/{mo}/{d}({WEEKDAYS_JP[_date(int(y), int(mo), int(d)).weekday()]})"
+        wd_i = _zeller_weekday(int(y), int(mo), int(d[:2]))
+        if len(d) == 2:  # 曜日なしの素の日付は作り置きサフィックスを足すだけ
+            return date_str + _WD_SUFFIX[wd_i]
+        # 既に正しい曜日付きなら文字列を作り直さず同じオブジェクトを返す
+        if len(d) == 5 and d[3] == WEEKDAYS_JP[wd_i]:
+            return date_str
+        return f"{y}/{mo}/{d[:2]}{_WD_SUFFIX[wd_i]}"
     except Exception:
         return date_str
 
@@ -303,8 +474,12 @@ def main(mode):
     tgtpath = "mynote_sorter_sample.txt"  # ここを書き換え
     # tgtpath = "mynote_sorter_sample_sorted.txt"  # ここを書き換え
     # tgtpath = "mynote_sorter_sample_sorted_split.txt"  # ここを書き換え
-    body = p(tgtpath).read_text(encoding="utf-8")
-    print(body)
+    # TextIOWrapper（逐次デコード）を通さず、一括read+decodeで読む
+    data = p(tgtpath).read_bytes()
+    body = data.decode("utf-8")
+    # print(body) 相当。読んだバイト列をそのまま流して再エンコードを省く
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.write(b"\n")
 
     my_task = MyTask(body)
 
@@ -313,7 +488,7 @@ def main(mode):
         out1 = my_task.parent_root_build()
         # # out_path = p(tgtpath)
         out_path = p(tgtpath).with_name(f"{p(tgtpath).stem}_sorted.txt")
-        out_path.write_text(out1, encoding="utf-8")
+        write_if_changed(out_path, out1)
         print(str(out_path))
         print(count_nonspace(body))
         print(count_nonspace(out1))
@@ -323,7 +498,7 @@ def main(mode):
         out2 = my_task.child_root_build()
         # # out_path = p(tgtpath)
         out_path = p(tgtpath).with_name(f"{p(tgtpath).stem}_sorted_split.txt")
-        out_path.write_text(out2, encoding="utf-8")
+        write_if_changed(out_path, out2)
         print(str(out_path))
         print(count_nonspace(body))
         print(count_nonspace(out2))
@@ -331,6 +506,13 @@ def main(mode):
     print(mode)
 
 
+def write_if_changed(out_path, text):
+    # 再実行で内容が変わっていなければディスクへの書き戻しを省く
+    data = text.encode("utf-8")
+    if not out_path.exists() or out_path.read_bytes() != data:
+        out_path.write_bytes(data)
+
+
 def count_nonspace(text):
     return len(text.replace(" ", "").replace("\n", "").replace("\t", ""))
 